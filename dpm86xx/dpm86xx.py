@@ -1,16 +1,123 @@
 # -*- coding: utf-8 -*-
+import functools
+import queue
+import threading
+import time
 import serial
-from typing import Union, Literal
+from concurrent.futures import Future
+from typing import Iterable, List, Tuple, Union, Literal
+
+_VALID_FUNCTIONS = frozenset(('r', 'w'))
+
+# Static command segments, precomputed once so building a command or an acknowledgement needs no two-digit
+# formatting. Dicts rather than tuples, so a negative address or function member is not taken as an index from the
+# end and turned into a well-formed command for another device.
+_ADDRESS_PREFIXES = {address: b':%02d' % address for address in range(100)}
+_FUNCTION_BYTES = {'r': b'r', 'w': b'w'}
+_FUNCTION_MEMBER_SEGMENTS = {function_member: b'%02d=' % function_member for function_member in range(100)}
+# Templates for the variable tail of a command, holding one or two operands.
+_OPERAND_FORMAT = b'%d,\r\n'
+_OPERANDS_FORMAT = b'%d,%d,\r\n'
+# Function members of the values that can be read from the device, by name.
+_READ_FUNCTION_MEMBERS = {
+    'maximum_output_voltage': 0,
+    'maximum_output_current': 1,
+    'voltage_setting': 10,
+    'current_setting': 11,
+    'output_status': 12,
+    'actual_voltage': 30,
+    'actual_current': 31,
+    'cc_cv_status': 32,
+    'temperature': 33,
+}
+# Length of the shortest possible response, by the function byte of the command: b':AArFF=V.\r\n' to a read with a
+# single-digit value, and the acknowledgment b':AAok\r\n' to a write.
+_MINIMUM_RESPONSE_LENGTHS = {ord('r'): 11, ord('w'): 7}
+# Offsets of the value in a response to a read command: b':AArFF=' precedes it and b'.\r\n' follows.
+_VALUE_START = 7
+_VALUE_END = -3
+_VALUE_TRAILER = b'.\r\n'
+# Time in seconds to wait for the rest of a response once its first bytes are read, matching the port timeout.
+_RESPONSE_TIMEOUT = 2.0
+
+
+def _to_centivolts(voltage: Union[float, int]) -> int:
+    # Floats (including subclasses like numpy.float64) are volts, anything else is taken as centivolts already.
+    # Rounding avoids losing a centivolt to binary floating point, e.g. 7.23 * 100 = 722.9999999999999.
+    return round(voltage * 100) if isinstance(voltage, float) else voltage
+
+
+def _to_milliampere(current: Union[float, int]) -> int:
+    # Floats (including subclasses like numpy.float64) are amperes, anything else is taken as milliamperes already.
+    return round(current * 1000) if isinstance(current, float) else current
+
+
+def _enable_low_latency(port: serial.Serial) -> None:
+    # USB serial adapters such as FTDI hold back received bytes for up to 16 ms by default on Linux, which dominates
+    # every command round trip. Low latency mode hands them over right away. The flag belongs to the tty and persists
+    # until the adapter is reconnected. Not available on other platforms or with drivers lacking support for it.
+    try:
+        port.set_low_latency_mode(True)
+    except (AttributeError, ValueError):
+        pass
+
+
+def _check_command(command: bytes) -> None:
+    # The expected response is chosen by the function byte of the command, see _read_response. Commands passed in
+    # from outside are checked for it before anything is written, so the port is not left with an unread response.
+    if len(command) < 4 or command[3] not in _MINIMUM_RESPONSE_LENGTHS:
+        raise ValueError(f'Not a read or write command: {command}')
+
+
+def _parse_response_value(response: bytes, command: bytes) -> int:
+    # Responses have the form b':AArFF=VALUE.\r\n', the value being framed by 7 leading and 3 trailing bytes. The
+    # leading bytes repeat those of the read command, so the value is taken from fixed offsets once they are checked.
+    if len(response) < 11:
+        raise IOError(f'Response is too short: {response}')
+    if not response.startswith(command[:_VALUE_START]):
+        raise IOError(f'Response does not belong to command {command}: {response}')
+    if not response.endswith(_VALUE_TRAILER):
+        # E.g. cut off by a timeout, slicing it at the fixed offset would drop digits of the value
+        raise IOError(f'Response is incomplete: {response}')
+    return int(response[_VALUE_START:_VALUE_END])  # may raise ValueError
 
 
 class DPM86XX:
-    def __init__(self, com_port=None, address=1, baud=9600):
-        if com_port is not None:
-            self._port = serial.Serial(com_port, baudrate=baud, timeout=2)
+    __slots__ = ('_port', '_address', '_read_commands', '_acknowledgement', '_received', '_lock', '_sender',
+                 '_sender_queue', '_sender_lock', '_previous_sender', 'sender_batch_size')
+
+    # Set to False to skip the parameter checks in make_command, e.g. when building commands from trusted inputs
+    # in a tight loop. Out-of-range operands then result in malformed commands instead of a ValueError, while
+    # addresses or function members outside 0 - 99 and functions other than 'r' or 'w' raise a KeyError.
+    validate_commands = True
+
+    def __init__(self, com_port=None, address=1, baud=9600, sender_batch_size=8):
         self._address = address
+        # The address is fixed for the lifetime of the instance, so all read commands can be prepared up front. This
+        # also validates the address, before any port is opened.
+        self._read_commands = {name: self._make_read_command(address, function_member)
+                               for name, function_member in _READ_FUNCTION_MEMBERS.items()}
+        self._acknowledgement = _ADDRESS_PREFIXES[address] + b'ok\r\n'
+        self._port = None
+        if com_port is not None:
+            self._port = serial.Serial(com_port, baudrate=baud, timeout=_RESPONSE_TIMEOUT)
+            _enable_low_latency(self._port)
+        # Bytes read from the port that belong to a response not yet handed out
+        self._received = bytearray()
+        # Serializes command exchanges between the caller and the background sender, see submit_command
+        self._lock = threading.Lock()
+        self._sender = None
+        self._sender_queue = None
+        # Guards starting and stopping the background sender, and queueing items for it
+        self._sender_lock = threading.Lock()
+        # The last stopped sender, which a new sender waits for, so commands are still sent in order
+        self._previous_sender = None
+        # The maximum number of queued commands the background sender writes at once, see submit_command. Responses
+        # are matched to commands by their order only, so a lost response affects every later command of the batch.
+        self.sender_batch_size = sender_batch_size
 
-    @staticmethod
-    def make_command(address: int, function: Literal['r', 'w'], function_member: int, operand: int,
+    @classmethod
+    def make_command(cls, address: int, function: Literal['r', 'w'], function_member: int, operand: int,
                      operand2: Union[int, None] = None) -> bytes:
         """
         Formats a command string for the Joy-IT programmable lab power supply DPM86XX series according
@@ -27,25 +134,83 @@ class DPM86XX:
         :return: The encoded command string ready to be sent over a serial connection.
         :rtype: bytes
         :raises ValueError: If any parameter is out of its valid range, or if `function` is not 'r' or 'w'.
+                            Not raised if `validate_commands` is disabled.
+        :raises KeyError: If `validate_commands` is disabled and the address or function member is outside 0 - 99, or
+                          `function` is not 'r' or 'w'.
         """
 
         # Create commands according to simple protocol description at
         # [link](https://joy-it.net/files/files/Produkte/JT-DPM8624/JT-DPM86XX_Communication_protocol_2023-01-05.pdf)
         # for Joy-IT programmable lab power supply DPM86XX series.
 
-        if not 1 <= address <= 99:
-            raise ValueError('Address must be in the range of 1 - 99.')
-        if not 0 <= function_member <= 99:
-            raise ValueError('Function member must be in the range of 0 - 99.')
-        if not 0 <= operand <= 65536:
-            raise ValueError('Operand must be in the range of 0 - 65536.')
-        if operand2 is not None:
-            if not 0 <= operand2 <= 65536:
+        if cls.validate_commands:
+            if not 1 <= address <= 99:
+                raise ValueError('Address must be in the range of 1 - 99.')
+            if not 0 <= function_member <= 99:
+                raise ValueError('Function member must be in the range of 0 - 99.')
+            if not 0 <= operand <= 65536:
+                raise ValueError('Operand must be in the range of 0 - 65536.')
+            if operand2 is not None and not 0 <= operand2 <= 65536:
                 raise ValueError('2nd operand must be in the range of 0 - 65536.')
-            operand = f'{operand},{operand2}'
-        if function not in ['r', 'w']:
-            raise ValueError('Function must be either \'r\' or \'w\'.')
-        return f':{address:02d}{function}{function_member:02d}={operand},\r\n'.encode()
+            if function not in _VALID_FUNCTIONS:
+                raise ValueError('Function must be either \'r\' or \'w\'.')
+        return cls._make_command_unchecked(address, function, function_member, operand, operand2)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _make_command_unchecked(address: int, function: Literal['r', 'w'], function_member: int, operand: int,
+                                operand2: Union[int, None] = None) -> bytes:
+        """
+        Formats a command like `make_command`, but without validating its parameters.
+
+        Meant for internal callers that have already validated the parameters themselves. Recently built commands are
+        cached, so commands issued repeatedly, e.g. polling the same value or re-sending a setpoint, are not formatted
+        anew. The validation in `make_command` is not cached and still applies to every call, whatever the setting of
+        `validate_commands` was when the command was first built.
+
+        :param address: The device address (1 - 99).
+        :param function: The command function, 'r' for read or 'w' for write.
+        :param function_member: The function member (0 - 99) to be accessed by the command.
+        :param operand: The primary operand for the command, in the range 0 - 65536.
+        :param operand2: An optional second operand for the command, in the range 0 - 65536. Default is None.
+        :return: The encoded command string ready to be sent over a serial connection.
+        :rtype: bytes
+        """
+        # Assemble the command from precomputed segments, only the operands need to be formatted.
+        if operand2 is None:
+            operands = _OPERAND_FORMAT % operand
+        else:
+            operands = _OPERANDS_FORMAT % (operand, operand2)
+        return b''.join((_ADDRESS_PREFIXES[address], _FUNCTION_BYTES[function],
+                         _FUNCTION_MEMBER_SEGMENTS[function_member], operands))
+
+    @classmethod
+    def _make_write_command(cls, address: int, function_member: int, operand: int,
+                            operand2: Union[int, None] = None) -> bytes:
+        """
+        Returns the write command for the given function member and operands, reusing recently built commands.
+
+        Holding a setpoint, stepping through a ramp repeatedly or retrying a setting sends the very same commands
+        again, which are then taken from the cache of `_make_command_unchecked` instead of being formatted anew. The
+        address check is done on every call, outside of that cache.
+
+        :param address: The device address (1 - 99).
+        :type address: int
+        :param function_member: The function member to be written.
+        :type function_member: int
+        :param operand: The primary operand for the command.
+        :type operand: int
+        :param operand2: An optional second operand for the command. Default is None.
+        :type operand2: Union[int, None]
+        :return: Encoded write command.
+        :rtype: bytes
+        :raises ValueError: If the address is out of its valid range.
+        """
+        # The callers validate the operands themselves and pass the function member as a constant, so only the
+        # address is left to be checked.
+        if cls.validate_commands and not 1 <= address <= 99:
+            raise ValueError('Address must be in the range of 1 - 99.')
+        return cls._make_command_unchecked(address, 'w', function_member, operand, operand2)
 
     @classmethod
     def make_write_voltage_command(cls, address: int, voltage: Union[float, int]) -> bytes:
@@ -54,7 +219,7 @@ class DPM86XX:
 
         This method formats a command to instruct a device to set a specified voltage. It accepts
         voltage values as either a float or an integer. For float values, it converts the voltage to
-        an integer representation (multiplied by 100) to comply with the command protocol, which
+        an integer representation (multiplied by 100 and rounded) to comply with the command protocol, which
         expects voltage in centivolts. The method ensures the voltage is within the acceptable range
         before creating the command.
 
@@ -67,11 +232,45 @@ class DPM86XX:
         :rtype: bytes
         :raises ValueError: If the voltage is outside the acceptable range of 0.00 to 60.00 V.
         """
-        if type(voltage) is float:
-            voltage = int(voltage * 100)
-        if not 0 <= voltage <= 6000:
+        return cls.make_write_voltage_in_centivolts_command(address, _to_centivolts(voltage))
+
+    @classmethod
+    def make_write_voltage_in_centivolts_command(cls, address: int, centivolts: int) -> bytes:
+        """
+        Creates a command to set a specific voltage, given in centivolts, at a given address.
+
+        Unlike `make_write_voltage_command`, this method does not dispatch on the type of the value and always
+        expects an integer number of centivolts.
+
+        :param address: The device address where the voltage should be set.
+        :type address: int
+        :param centivolts: The voltage value to set, in centivolts.
+        :type centivolts: int
+        :return: A byte string representing the formatted command to write the voltage.
+        :rtype: bytes
+        :raises ValueError: If the voltage is outside the acceptable range of 0 to 6000 cV.
+        """
+        if not 0 <= centivolts <= 6000:
             raise ValueError('Voltage must be in the range of 0.00 to 60.00 V')
-        return cls.make_command(address, 'w', 10, voltage)
+        return cls._make_write_command(address, 10, centivolts)
+
+    @classmethod
+    def make_write_voltage_in_volts_command(cls, address: int, volts: float) -> bytes:
+        """
+        Creates a command to set a specific voltage, given in volts, at a given address.
+
+        Unlike `make_write_voltage_command`, this method does not dispatch on the type of the value and always
+        interprets it as volts, so integer volts are fine as well. The value is rounded to the nearest centivolt.
+
+        :param address: The device address where the voltage should be set.
+        :type address: int
+        :param volts: The voltage value to set, in volts.
+        :type volts: float
+        :return: A byte string representing the formatted command to write the voltage.
+        :rtype: bytes
+        :raises ValueError: If the voltage is outside the acceptable range of 0.00 to 60.00 V.
+        """
+        return cls.make_write_voltage_in_centivolts_command(address, round(volts * 100))
 
     @classmethod
     def make_write_current_command(cls, address: int, current: Union[float, int]) -> bytes:
@@ -80,7 +279,7 @@ class DPM86XX:
 
         This method formats a command to instruct a device to set a specified current. It accepts
         current values as either a float or an integer. For float values, it converts the current to
-        an integer representation (multiplied by 1000) to comply with the command protocol, which
+        an integer representation (multiplied by 1000 and rounded) to comply with the command protocol, which
         expects current in milliamperes. The method ensures the current is within the acceptable range
         before creating the command.
 
@@ -93,11 +292,46 @@ class DPM86XX:
         :rtype: bytes
         :raises ValueError: If the current is outside the acceptable range of 0.000 to 24.000 A.
         """
-        if type(current) is float:
-            current = int(current * 1000)
-        if not 0 <= current <= 24000:
+        return cls.make_write_current_in_milliampere_command(address, _to_milliampere(current))
+
+    @classmethod
+    def make_write_current_in_milliampere_command(cls, address: int, milliampere: int) -> bytes:
+        """
+        Creates a command to set a specific current, given in milliamperes, at a given address.
+
+        Unlike `make_write_current_command`, this method does not dispatch on the type of the value and always
+        expects an integer number of milliamperes.
+
+        :param address: The device address where the current should be set.
+        :type address: int
+        :param milliampere: The current value to set, in milliamperes.
+        :type milliampere: int
+        :return: A byte string representing the formatted command to write the current.
+        :rtype: bytes
+        :raises ValueError: If the current is outside the acceptable range of 0 to 24000 mA.
+        """
+        if not 0 <= milliampere <= 24000:
             raise ValueError('Current must be in the range of 0.000 to 24.000 A')
-        return cls.make_command(address, 'w', 11, current)
+        return cls._make_write_command(address, 11, milliampere)
+
+    @classmethod
+    def make_write_current_in_amperes_command(cls, address: int, amperes: float) -> bytes:
+        """
+        Creates a command to set a specific current, given in amperes, at a given address.
+
+        Unlike `make_write_current_command`, this method does not dispatch on the type of the value and always
+        interprets it as amperes, so integer amperes are fine as well. The value is rounded to the nearest
+        milliampere.
+
+        :param address: The device address where the current should be set.
+        :type address: int
+        :param amperes: The current value to set, in amperes.
+        :type amperes: float
+        :return: A byte string representing the formatted command to write the current.
+        :rtype: bytes
+        :raises ValueError: If the current is outside the acceptable range of 0.000 to 24.000 A.
+        """
+        return cls.make_write_current_in_milliampere_command(address, round(amperes * 1000))
 
     @classmethod
     def make_write_output_status_command(cls, address: int, status: Union[bool, int]) -> bytes:
@@ -117,10 +351,8 @@ class DPM86XX:
         :return: A byte string representing the formatted command to set the output status.
         :rtype: bytes
         """
-        if type(status) is int:
-            status = not status == 0
-        status = 1 if status else 0
-        return cls.make_command(address, 'w', 12, status)
+        # Truthiness covers bool and int alike, and there are only two distinct commands per address to be cached.
+        return cls._make_write_command(address, 12, 1 if status else 0)
 
     @classmethod
     def make_write_voltage_and_current_command(cls, address: int, voltage: Union[float, int],
@@ -143,15 +375,73 @@ class DPM86XX:
         :rtype: bytes
         :raises ValueError: If the voltage or current is outside their acceptable ranges.
         """
-        if type(voltage) is float:
-            voltage = int(voltage * 100)
-        if not 0 <= voltage <= 6000:
+        return cls.make_write_centivolts_and_milliampere_command(address, _to_centivolts(voltage),
+                                                             _to_milliampere(current))
+
+    @classmethod
+    def make_write_centivolts_and_milliampere_command(cls, address: int, centivolts: int,
+                                                      milliampere: int) -> bytes:
+        """
+        Creates a command to set both voltage, given in centivolts, and current, given in milliamperes, at a given
+        address.
+
+        Unlike `make_write_voltage_and_current_command`, this method does not dispatch on the type of the values and
+        always expects integer numbers of centivolts and milliamperes.
+
+        :param address: The device address where the voltage and current should be set.
+        :type address: int
+        :param centivolts: The voltage value to set, in centivolts.
+        :type centivolts: int
+        :param milliampere: The current value to set, in milliamperes.
+        :type milliampere: int
+        :return: A byte string representing the formatted command to set both voltage and current.
+        :rtype: bytes
+        :raises ValueError: If the voltage or current is outside their acceptable ranges.
+        """
+        if not 0 <= centivolts <= 6000:
             raise ValueError('Voltage must be in the range of 0.00 to 60.00 V')
-        if type(current) is float:
-            current = int(current * 1000)
-        if not 0 <= current <= 24000:
+        if not 0 <= milliampere <= 24000:
             raise ValueError('Current must be in the range of 0.000 to 24.000 A')
-        return cls.make_command(address, 'w', 20, voltage, current)
+        return cls._make_write_command(address, 20, centivolts, milliampere)
+
+    @classmethod
+    def _make_read_command(cls, address: int, function_member: int) -> bytes:
+        """
+        Returns the read command for the given function member, reusing recently built commands.
+
+        The parameters are validated by `make_command` on every call, and the command itself is taken from the
+        bounded cache of `_make_command_unchecked` once it has been built. The getters do not use this method, as every
+        instance keeps the read commands for its own address.
+
+        :param address: The address of the device.
+        :type address: int
+        :param function_member: The function member to be read.
+        :type function_member: int
+        :return: Encoded read command.
+        :rtype: bytes
+        :raises ValueError: If the address or the function member is out of its valid range.
+        """
+        return cls.make_command(address, 'r', function_member, 0)
+
+    @classmethod
+    def make_write_volts_and_amperes_command(cls, address: int, volts: float, amperes: float) -> bytes:
+        """
+        Creates a command to set both voltage, given in volts, and current, given in amperes, at a given address.
+
+        Unlike `make_write_voltage_and_current_command`, this method does not dispatch on the type of the values and
+        always interprets them as volts and amperes. The values are rounded to the nearest centivolt and milliampere.
+
+        :param address: The device address where the voltage and current should be set.
+        :type address: int
+        :param volts: The voltage value to set, in volts.
+        :type volts: float
+        :param amperes: The current value to set, in amperes.
+        :type amperes: float
+        :return: A byte string representing the formatted command to set both voltage and current.
+        :rtype: bytes
+        :raises ValueError: If the voltage or current is outside their acceptable ranges.
+        """
+        return cls.make_write_centivolts_and_milliampere_command(address, round(volts * 100), round(amperes * 1000))
 
     @classmethod
     def make_read_maximum_output_voltage_command(cls, address: int) -> bytes:
@@ -163,7 +453,7 @@ class DPM86XX:
         :return: Encoded command to read the maximum output voltage.
         :rtype: bytes
         """
-        return cls.make_command(address, 'r', 0, 0)
+        return cls._make_read_command(address, _READ_FUNCTION_MEMBERS['maximum_output_voltage'])
 
     @classmethod
     def make_read_maximum_output_current_command(cls, address: int) -> bytes:
@@ -175,7 +465,7 @@ class DPM86XX:
         :return: Encoded command to read the maximum output current.
         :rtype: bytes
         """
-        return cls.make_command(address, 'r', 1, 0)
+        return cls._make_read_command(address, _READ_FUNCTION_MEMBERS['maximum_output_current'])
 
     @classmethod
     def make_read_voltage_setting_command(cls, address: int) -> bytes:
@@ -187,7 +477,7 @@ class DPM86XX:
         :return: Encoded command to read the voltage setting.
         :rtype: bytes
         """
-        return cls.make_command(address, 'r', 10, 0)
+        return cls._make_read_command(address, _READ_FUNCTION_MEMBERS['voltage_setting'])
 
     @classmethod
     def make_read_current_setting_command(cls, address: int) -> bytes:
@@ -199,7 +489,7 @@ class DPM86XX:
         :return: Encoded command to read the current setting.
         :rtype: bytes
         """
-        return cls.make_command(address, 'r', 11, 0)
+        return cls._make_read_command(address, _READ_FUNCTION_MEMBERS['current_setting'])
 
     @classmethod
     def make_read_output_status_command(cls, address: int) -> bytes:
@@ -211,7 +501,7 @@ class DPM86XX:
         :return: Encoded command to read the output status (on/off).
         :rtype: bytes
         """
-        return cls.make_command(address, 'r', 12, 0)
+        return cls._make_read_command(address, _READ_FUNCTION_MEMBERS['output_status'])
 
     @classmethod
     def make_read_actual_voltage_command(cls, address: int) -> bytes:
@@ -223,7 +513,7 @@ class DPM86XX:
         :return: Encoded command to read the actual output voltage.
         :rtype: bytes
         """
-        return cls.make_command(address, 'r', 30, 0)
+        return cls._make_read_command(address, _READ_FUNCTION_MEMBERS['actual_voltage'])
 
     @classmethod
     def make_read_actual_current_command(cls, address: int) -> bytes:
@@ -235,7 +525,7 @@ class DPM86XX:
         :return: Encoded command to read the actual output current.
         :rtype: bytes
         """
-        return cls.make_command(address, 'r', 31, 0)
+        return cls._make_read_command(address, _READ_FUNCTION_MEMBERS['actual_current'])
 
     @classmethod
     def make_read_cc_cv_status_command(cls, address: int) -> bytes:
@@ -247,7 +537,7 @@ class DPM86XX:
         :return: Encoded command to read the CC/CV status.
         :rtype: bytes
         """
-        return cls.make_command(address, 'r', 32, 0)
+        return cls._make_read_command(address, _READ_FUNCTION_MEMBERS['cc_cv_status'])
 
     @classmethod
     def make_read_temperature_command(cls, address: int) -> bytes:
@@ -259,7 +549,88 @@ class DPM86XX:
         :return: A byte string representing the formatted command to read the device's internal temperature.
         :rtype: bytes
         """
-        return cls.make_command(address, 'r', 33, 0)
+        return cls._make_read_command(address, _READ_FUNCTION_MEMBERS['temperature'])
+
+    @classmethod
+    def make_read_commands_batch(cls, addresses: Iterable[int], function_member: int) -> List[bytes]:
+        """
+        Generates the read commands for the same function member on several devices at once.
+
+        Useful for polling a number of daisy-chained devices, e.g. for their actual voltage (function member 30). The
+        addresses may be given as any iterable of integers, including NumPy arrays.
+
+        :param addresses: The addresses of the devices.
+        :type addresses: Iterable[int]
+        :param function_member: The function member to be read, e.g. 30 for the actual voltage.
+        :type function_member: int
+        :return: A list of encoded read commands, one per address.
+        :rtype: List[bytes]
+        :raises ValueError: If an address or the function member is out of its valid range.
+        """
+        make_read_command = cls._make_read_command
+        return [make_read_command(address, function_member) for address in addresses]
+
+    @classmethod
+    def make_write_voltage_commands_batch(cls, addresses: Iterable[int],
+                                          voltages: Iterable[Union[float, int]]) -> List[bytes]:
+        """
+        Generates commands to set the voltage on several devices or a sequence of voltages at once.
+
+        Addresses and voltages are paired up element-wise, so a voltage ramp for a single device can be built by
+        repeating its address. Voltages are interpreted as in `make_write_voltage_command`.
+
+        :param addresses: The addresses of the devices.
+        :type addresses: Iterable[int]
+        :param voltages: The voltage values to set, in volts (as floats) or centivolts (as integers).
+        :type voltages: Iterable[Union[float, int]]
+        :return: A list of encoded commands to write the voltages.
+        :rtype: List[bytes]
+        :raises ValueError: If an address or voltage is out of its valid range.
+        """
+        make_write_voltage_command = cls.make_write_voltage_command
+        return [make_write_voltage_command(address, voltage) for address, voltage in zip(addresses, voltages)]
+
+    @classmethod
+    def make_write_voltage_and_current_commands_batch(cls, addresses: Iterable[int],
+                                                      voltages: Iterable[Union[float, int]],
+                                                      currents: Iterable[Union[float, int]]) -> List[bytes]:
+        """
+        Generates commands to set both voltage and current on several devices or for a whole sequence at once.
+
+        Addresses, voltages and currents are paired up element-wise, so e.g. a ramp table for a single device can be
+        built ahead of time by repeating its address. Values are interpreted as in
+        `make_write_voltage_and_current_command`.
+
+        :param addresses: The addresses of the devices.
+        :type addresses: Iterable[int]
+        :param voltages: The voltage values to set, in volts (as floats) or centivolts (as integers).
+        :type voltages: Iterable[Union[float, int]]
+        :param currents: The current values to set, in amperes (as floats) or milliamperes (as integers).
+        :type currents: Iterable[Union[float, int]]
+        :return: A list of encoded commands to write voltage and current.
+        :rtype: List[bytes]
+        :raises ValueError: If an address, voltage or current is out of its valid range.
+        """
+        make_write_voltage_and_current_command = cls.make_write_voltage_and_current_command
+        return [make_write_voltage_and_current_command(address, voltage, current)
+                for address, voltage, current in zip(addresses, voltages, currents)]
+
+    @property
+    def port(self) -> serial.Serial:
+        """
+        The serial port used to communicate with the device.
+
+        Unlike an assertion, the check for a configured port is not stripped when Python runs with optimizations
+        enabled (-O).
+
+        :return: The configured serial port.
+        :rtype: serial.Serial
+        :raises RuntimeError: If the communication port has not been configured.
+        """
+        port = self._port
+        if port is None:
+            raise RuntimeError('The communication port has not been configured, see set_port().')
+        return port
 
     def set_port(self, port: Union[str, serial.Serial], baud: int = 9600) -> None:
         """
@@ -280,7 +651,292 @@ class DPM86XX:
         if type(port) is serial.Serial:
             self._port = port
             return
-        self._port = serial.Serial(port, baud)
+        self._port = serial.Serial(port, baud, timeout=_RESPONSE_TIMEOUT)
+        _enable_low_latency(self._port)
+
+    def close(self) -> None:
+        """
+        Stops the background sender, if any, and closes the communication port.
+
+        The port is closed even if it was passed in by `set_port`. Afterwards, the instance has no port configured
+        until `set_port` is called again. Does nothing if no port is configured.
+        """
+        self.stop_sender()
+        # Waits for an exchange in progress in another thread, which would otherwise lose its port mid-way
+        with self._lock:
+            port = self._port
+            if port is None:
+                return
+            self._port = None
+            self._received.clear()
+            port.close()
+
+    def __enter__(self) -> 'DPM86XX':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _read_response(self, command: bytes) -> bytes:
+        """
+        Reads the response of the device to the given command.
+
+        pyserial's `read_until` fetches one byte per call. Instead, the shortest possible response to the command is
+        requested at once, and the remainder of longer responses is taken in chunks of whatever has already arrived.
+        Bytes received beyond the end of the response, e.g. the start of the next response during `send_batch`, are
+        kept in a receive buffer for the next call. If the first read times out, whatever has arrived is handed out
+        right away. Otherwise, completing a response may take at most `_RESPONSE_TIMEOUT` seconds on top of it.
+
+        :param command: The encoded command the response belongs to.
+        :type command: bytes
+        :return: The response of the device, terminated by b'\r\n' unless the read timed out.
+        :rtype: bytes
+        """
+        port = self._port
+        read = port.read
+        received = self._received
+        missing = _MINIMUM_RESPONSE_LENGTHS[command[3]] - len(received)
+        timed_out = False
+        if missing > 0:
+            chunk = read(missing)
+            received += chunk
+            # pyserial returns less than requested only once the timeout has expired, e.g. if the device did not
+            # answer at all. Waiting for the rest would cost another full timeout.
+            timed_out = len(chunk) < missing
+        end = received.find(b'\r\n') + 2
+        if end < 2 and timed_out:
+            end = len(received)
+        elif end < 2:
+            # The port timeout applies to every single read, so a device trickling garbage without a terminator could
+            # keep the loop going forever. The deadline bounds the whole response instead.
+            deadline = time.monotonic() + _RESPONSE_TIMEOUT
+            while end < 2:
+                chunk = read(max(1, port.in_waiting))
+                received += chunk
+                end = received.find(b'\r\n') + 2
+                if end < 2 and (not chunk or time.monotonic() > deadline):
+                    # Timed out, hand out the incomplete response
+                    end = len(received)
+                    break
+        response = bytes(received[:end])
+        del received[:end]
+        return response
+
+    def _discard_stale_input(self, port: serial.Serial) -> None:
+        """
+        Discards input left over from previous exchanges, before a new command is sent.
+
+        Every exchange reads exactly the responses to its commands, so anything still pending at this point is stale,
+        e.g. the late remainder of a response that timed out. Left in place, it would be taken for the response to
+        the next command.
+
+        :param port: The communication port of the device.
+        :type port: serial.Serial
+        """
+        self._received.clear()
+        pending = port.in_waiting
+        if pending:
+            port.read(pending)
+
+    def _transceive(self, command: bytes) -> bytes:
+        """
+        Sends a command to the device and reads back its response.
+
+        :param command: The encoded command to send.
+        :type command: bytes
+        :return: The response of the device, terminated by b'\r\n' unless the read timed out.
+        :rtype: bytes
+        :raises RuntimeError: If the communication port has not been configured.
+        """
+        # The port is taken under the lock, so a concurrent close() is either waited for or noticed
+        with self._lock:
+            port = self.port
+            self._discard_stale_input(port)
+            port.write(command)
+            return self._read_response(command)
+
+    def _is_acknowledgement(self, response: bytes) -> bool:
+        """
+        Checks whether a response is the acknowledgment of a write command.
+
+        :param response: The response of the device.
+        :type response: bytes
+        :return: True if the response is b':AAok\r\n' with AA being the address of this device, False otherwise.
+        :rtype: bool
+        """
+        # The device always responses with b':AAok\r\n' (AA being the address). This does only mean the device received
+        # a command-like byte string, disregarding its actual content. Thus, we cannot tell if the
+        # command was successful, but only if the command was received.
+        # The whole response is compared: it is read as a single chunk anyway, and the terminator must have been
+        # consumed before the next response can be read.
+        return response == self._acknowledgement
+
+    def send_batch(self, commands: Iterable[bytes], inter_command_delay: float = 0.0) -> List[bytes]:
+        """
+        Sends several commands to the device back-to-back and reads back their responses afterwards.
+
+        Every command is terminated by b'\r\n' and parsed by the device on its own, so the commands can be joined and
+        handed to the serial port at once. This saves the per-write overhead of the operating system and, on USB
+        serial adapters, of the USB transfers. If the device needs time between commands, e.g. to let a setting
+        settle during a ramp, an inter-command delay can be given, in which case the commands are written one by one.
+        Either way, no command waits for the response of its predecessor. The device still answers every command
+        separately, so one response is read per command at the end, keeping the input clean for subsequent commands.
+
+        :param commands: The encoded commands to send, e.g. as created by the `make_*_command` methods.
+        :type commands: Iterable[bytes]
+        :param inter_command_delay: The time to wait after each command, in seconds. Default is 0, sending all
+                                    commands with a single write.
+        :type inter_command_delay: float
+        :return: The responses of the device, in the order of the commands. Once a response has timed out, the
+                 remaining ones are not waited for and returned as b''.
+        :rtype: List[bytes]
+        :raises RuntimeError: If the communication port has not been configured.
+        :raises ValueError: If any command is neither a read nor a write command. Nothing is sent then.
+        """
+        commands = list(commands)
+        for command in commands:
+            _check_command(command)
+        with self._lock:
+            port = self.port
+            self._discard_stale_input(port)
+            if inter_command_delay > 0:
+                write = port.write
+                sleep = time.sleep
+                for command in commands:
+                    write(command)
+                    sleep(inter_command_delay)
+            else:
+                port.write(b''.join(commands))
+            read_response = self._read_response
+            responses = []
+            for command in commands:
+                response = read_response(command)
+                responses.append(response)
+                if not response.endswith(b'\r\n'):
+                    # Timed out, the device is not expected to answer the remaining commands in time either
+                    responses += [b''] * (len(commands) - len(responses))
+                    break
+            return responses
+
+    def submit_command(self, command: bytes) -> Future:
+        """
+        Queues a command to be sent to the device by a background thread and returns immediately.
+
+        The background thread is started with the first submitted command, so the caller does not wait for the serial
+        transfer. The thread takes the commands queued by then, up to `sender_batch_size` at once, and writes them in
+        one go, i.e. the next command is written before the response to the previous one has arrived. If a response
+        is incomplete or reading it fails, the futures of that command and of the rest of its batch fail, as their
+        responses can no longer be told apart. Commands sent directly, e.g. by the setters, are never interleaved with
+        queued ones. Use `flush` to wait for all submitted commands.
+
+        :param command: The encoded command to send, e.g. as created by the `make_*_command` methods.
+        :type command: bytes
+        :return: A future that resolves to the response of the device, or to the error raised while sending the
+                 command, e.g. RuntimeError if the communication port has not been configured.
+        :rtype: concurrent.futures.Future
+        :raises ValueError: If the command is neither a read nor a write command.
+        """
+        _check_command(command)
+        future = Future()
+        with self._sender_lock:
+            if self._sender is None:
+                self._sender_queue = queue.SimpleQueue()
+                self._sender = threading.Thread(target=self._send_queued_commands,
+                                                args=(self._sender_queue, self._previous_sender),
+                                                name='DPM86XX sender', daemon=True)
+                self._sender.start()
+            self._sender_queue.put((command, future))
+        return future
+
+    def flush(self, timeout: Union[float, None] = None) -> None:
+        """
+        Waits until all commands submitted with `submit_command` so far have been sent and their responses read.
+
+        Does nothing if no background thread is running.
+
+        :param timeout: The maximum time to wait, in seconds. Default is None, waiting without limit.
+        :type timeout: Union[float, None]
+        :raises concurrent.futures.TimeoutError: If the commands have not been handled within the timeout.
+        """
+        marker = Future()
+        with self._sender_lock:
+            if self._sender is None:
+                return
+            self._sender_queue.put((None, marker))
+        marker.result(timeout)
+
+    def stop_sender(self) -> None:
+        """
+        Stops the background thread started by `submit_command`, after it has sent all commands queued so far.
+
+        Does nothing if no background thread is running. Submitting another command starts a new one, which sends
+        its commands only after the stopped thread has finished.
+        """
+        with self._sender_lock:
+            sender = self._sender
+            if sender is None:
+                return
+            # Nothing can be queued behind the stop marker, as the queue is dropped under the same lock
+            self._sender_queue.put(None)
+            self._sender = None
+            self._sender_queue = None
+            self._previous_sender = sender
+        # Joined without holding the lock, so callbacks of the remaining futures may submit further commands
+        if sender is not threading.current_thread():
+            sender.join()
+
+    def _send_queued_commands(self, commands: queue.SimpleQueue,
+                              previous_sender: Union[threading.Thread, None]) -> None:
+        # Runs in the background thread, until stop_sender() queues None.
+        if previous_sender is not None:
+            previous_sender.join()
+        while True:
+            items = [commands.get()]
+            # Take whatever else has been queued meanwhile, so it is sent in one batch
+            batch_size = self.sender_batch_size
+            while items[-1] is not None and len(items) < batch_size and not commands.empty():
+                items.append(commands.get())
+            stop = items[-1] is None
+            if stop:
+                items.pop()
+            # Items without a command are flush() markers, resolved once everything queued before them is done
+            batch = [(command, future) for command, future in items
+                     if command is not None and future.set_running_or_notify_cancel()]
+            if batch:
+                self._send_batch_for_futures(batch)
+            for command, future in items:
+                if command is None:
+                    future.set_result(None)
+            if stop:
+                # Nothing is expected behind the stop marker, anything there would never be sent
+                while not commands.empty():
+                    item = commands.get()
+                    if item is not None:
+                        item[1].set_exception(RuntimeError('The background sender has been stopped.'))
+                return
+
+    def _send_batch_for_futures(self, batch: List[Tuple[bytes, Future]]) -> None:
+        # Like send_batch, but resolves the future of every command with its response as far as the responses could
+        # be read, and fails the futures from the first failing response onward only.
+        responses = []
+        error = None
+        try:
+            with self._lock:
+                port = self.port
+                self._discard_stale_input(port)
+                port.write(b''.join(command for command, _ in batch))
+                for command, _ in batch:
+                    response = self._read_response(command)
+                    if not response.endswith(b'\r\n'):
+                        raise IOError(f'Incomplete response to {command}: {response}')
+                    responses.append(response)
+        except Exception as exception:
+            error = exception
+        # Resolved outside the lock, so callbacks of the futures may talk to the device
+        for (_, future), response in zip(batch, responses):
+            future.set_result(response)
+        for _, future in batch[len(responses):]:
+            future.set_exception(error)
 
     def get_temperature(self) -> int:
         """
@@ -292,20 +948,14 @@ class DPM86XX:
 
         :return: The temperature read from the device.
         :rtype: int
-        :raises AssertionError: If the communication port has not been configured.
+        :raises RuntimeError: If the communication port has not been configured.
         :raises IOError: If the response from the device is shorter than expected, indicating incomplete or corrupted
                 data.
         :raises ValueError: If converting the temperature portion of the response to an integer fails, indicating an
                 invalid format.
         """
-        assert self._port is not None
-        command = self.make_read_temperature_command(self._address)
-        self._port.write(command)
-        response = self._port.read_until(b'\r\n')
-        if len(response) < 11:
-            raise IOError(f'Response is too short: {response}')
-        result = int(response[7:-3])  # may raise ValueError
-        return result
+        command = self._read_commands['temperature']
+        return _parse_response_value(self._transceive(command), command)
 
     def set_voltage_in_centivolts(self, voltage_in_centivolts: int) -> bool:
         """
@@ -320,24 +970,17 @@ class DPM86XX:
         :type voltage_in_centivolts: int
         :return: True if the device acknowledges receipt of the command with b':01ok\r\n', indicating
                  the command was received. This does not necessarily mean the command was executed successfully.
-        :raises AssertionError: If the communication port has not been configured.
+        :raises RuntimeError: If the communication port has not been configured.
         """
-        assert self._port is not None
-        command = self.make_write_voltage_command(self._address, voltage_in_centivolts)
-        self._port.write(command)
-        response = self._port.read_until(b'\r\n')
-        # The device always responses with b':AAok\r\n' (AA being the address). This does only mean the device received
-        # a command-like byte string, disregarding its actual content. Thus, we cannot tell if the
-        # command was successful, but only if the command was received.
-        return response == f':{self._address:02d}ok\r\n'.encode()
+        command = self.make_write_voltage_in_centivolts_command(self._address, voltage_in_centivolts)
+        return self._is_acknowledgement(self._transceive(command))
 
     def set_voltage(self, voltage: float) -> bool:
         """
         Attempts to set the device's voltage level, specified in volts.
 
-        Validates the input voltage to ensure it is a float, converting if necessary, before generating
-        and sending the command to the device. Ensures that the communication port is available before
-        proceeding. The device's response, b':AAok\r\n' (AA being the address), signifies that the command was received. It's
+        Converts the input voltage to centivolts, rounding to the nearest centivolt, and delegates the command
+        sending to `set_voltage_in_centivolts`. The device's response, b':AAok\r\n' (AA being the address), signifies that the command was received. It's
         important to note that this response does not indicate the successful execution of the command,
         but rather the correct format of the received command.
 
@@ -346,20 +989,11 @@ class DPM86XX:
         :return: True if the device acknowledges receipt of the command with b':AAok\r\n' (AA being the address), indicating
                  the command was received in the correct format but not necessarily executed as intended.
         :rtype: bool
-        :raises AssertionError: If the communication port has not been configured.
+        :raises RuntimeError: If the communication port has not been configured.
         :raises ValueError: If the input voltage cannot be converted to a float, indicating an invalid
                  input type.
         """
-        assert self._port is not None
-        if type(voltage) is not float:
-            voltage = float(voltage)  # may raise ValueError
-        command = self.make_write_voltage_command(self._address, voltage)
-        self._port.write(command)
-        response = self._port.read_until(b'\r\n')
-        # The device always responses with b':AAok\r\n' (AA being the address). This does only mean the device received
-        # a command-like byte string, disregarding its actual content. Thus, we cannot tell if the
-        # command was successful, but only if the command was received.
-        return response == f':{self._address:02d}ok\r\n'.encode()
+        return self.set_voltage_in_centivolts(round(float(voltage) * 100))  # float() may raise ValueError
 
     def get_voltage_in_centivolts(self) -> int:
         """
@@ -371,19 +1005,13 @@ class DPM86XX:
 
         :return: The voltage setting of the device in centivolts.
         :rtype: float
-        :raises AssertionError: If the communication port has not been configured.
+        :raises RuntimeError: If the communication port has not been configured.
         :raises IOError: If the response from the device is shorter than expected, suggesting incomplete
                          or corrupted data.
         :raises ValueError: If converting the response to an integer fails, indicating an invalid response format.
         """
-        assert self._port is not None
-        command = self.make_read_voltage_setting_command(self._address)
-        self._port.write(command)
-        response = self._port.read_until(b'\r\n')
-        if len(response) < 11:
-            raise IOError(f'Response is too short: {response}')
-        result = int(response[7:-3])  # may raise ValueError
-        return result
+        command = self._read_commands['voltage_setting']
+        return _parse_response_value(self._transceive(command), command)
 
     def get_voltage(self) -> float:
         """
@@ -396,7 +1024,7 @@ class DPM86XX:
 
         :return: The voltage setting of the device, converted to volts.
         :rtype: float
-        :raises AssertionError: If the communication port has not been configured.
+        :raises RuntimeError: If the communication port has not been configured.
         :raises IOError: If the response from the device is shorter than expected, suggesting incomplete
                          or corrupted data.
         :raises ValueError: If converting the response to an integer fails, indicating an invalid response format.
@@ -418,12 +1046,12 @@ class DPM86XX:
         :type retries: int
         :return: True if the voltage setting is successfully verified within the given number of retries, False otherwise.
         :rtype: bool
-        :raises AssertionError: If the communication port has not been configured.
+        :raises RuntimeError: If the communication port has not been configured.
         :raises IOError: If the response from the device is shorter than expected, suggesting incomplete
                          or corrupted data.
         :raises ValueError: If converting the response to an integer fails, indicating an invalid response format.
         """
-        centivolts = int(voltage * 100)  # Convert volts to centivolts for setting.
+        centivolts = round(voltage * 100)  # Convert volts to centivolts for setting.
         while retries > 0:
             self.set_voltage_in_centivolts(centivolts)
             if self.get_voltage_in_centivolts() == centivolts:
@@ -441,19 +1069,13 @@ class DPM86XX:
 
         :return: The actual voltage level read from the device, in centivolts.
         :rtype: int
-        :raises AssertionError: If the communication port has not been configured.
+        :raises RuntimeError: If the communication port has not been configured.
         :raises IOError: If the response from the device is shorter than expected, suggesting incomplete
                  or corrupted data.
         :raises ValueError: If converting the response to an integer fails, indicating an invalid response format.
         """
-        assert self._port is not None
-        command = self.make_read_actual_voltage_command(self._address)
-        self._port.write(command)
-        response = self._port.read_until(b'\r\n')
-        if len(response) < 11:
-            raise IOError(f'Response is too short: {response}')
-        result = int(response[7:-3])  # may raise ValueError
-        return result
+        command = self._read_commands['actual_voltage']
+        return _parse_response_value(self._transceive(command), command)
 
     def get_actual_voltage(self) -> float:
         """
@@ -464,13 +1086,48 @@ class DPM86XX:
 
         :return: The actual voltage level read from the device, in volts.
         :rtype: float
-        :raises AssertionError: If the communication port has not been configured.
+        :raises RuntimeError: If the communication port has not been configured.
         :raises IOError: If the response from the device is shorter than expected, suggesting incomplete
                  or corrupted data.
         :raises ValueError: If converting the response to an integer fails, indicating an invalid response format.
         """
         return self.get_actual_voltage_in_centivolts() / 100.0
 
+    def wait_until_stable(self, voltage: float, tolerance: float = 0.02, timeout: float = 0.3,
+                          interval: float = 0.01) -> bool:
+        """
+        Waits until the actual output voltage is within a tolerance of the given voltage.
+
+        Polls the actual voltage and returns as soon as it is close enough to the target, instead of sleeping for a
+        fixed time after enabling the output or changing a setting. The output has to be enabled for the actual
+        voltage to follow the setting, and in CC mode it may never reach the target, in which case the method gives up
+        after the timeout.
+
+        :param voltage: The expected output voltage, in volts.
+        :type voltage: float
+        :param tolerance: The maximum deviation from the expected voltage, in volts. Default is 0.02.
+        :type tolerance: float
+        :param timeout: The maximum time to wait, in seconds. Default is 0.3.
+        :type timeout: float
+        :param interval: The time to wait between two readings, in seconds. Default is 0.01.
+        :type interval: float
+        :return: True if the actual voltage reached the expected voltage within the timeout, False otherwise.
+        :rtype: bool
+        :raises RuntimeError: If the communication port has not been configured.
+        :raises IOError: If the response from the device is shorter than expected, suggesting incomplete
+                 or corrupted data.
+        :raises ValueError: If converting the response to an integer fails, indicating an invalid response format.
+        """
+        centivolts = round(voltage * 100)
+        tolerance_in_centivolts = round(tolerance * 100)
+        deadline = time.monotonic() + timeout
+        while True:
+            if abs(self.get_actual_voltage_in_centivolts() - centivolts) <= tolerance_in_centivolts:
+                return True
+            if time.monotonic() + interval > deadline:
+                return False
+            time.sleep(interval)
+
     def set_output_status(self, status) -> bool:
         """
         Sends a command to the device to set the output status (on/off).
@@ -482,16 +1139,10 @@ class DPM86XX:
         :param status: The desired output status; True to enable or False to disable the output.
         :return: True if the device acknowledges receipt of the command with b':AAok\r\n' (AA being the address), indicating
                  the command was received. It does not ensure the command was executed as intended.
-        :raises AssertionError: If the communication port has not been configured.
+        :raises RuntimeError: If the communication port has not been configured.
         """
-        assert self._port is not None
         command = self.make_write_output_status_command(self._address, status)
-        self._port.write(command)
-        response = self._port.read_until(b'\r\n')
-        # The device always responses with b':AAok\r\n' (AA being the address). This does only mean the device received
-        # a command-like byte string, disregarding its actual content. Thus, we cannot tell if the
-        # command was successful, but only if the command was received.
-        return response == f':{self._address:02d}ok\r\n'.encode()
+        return self._is_acknowledgement(self._transceive(command))
 
     def get_output_status(self) -> bool:
         """
@@ -503,19 +1154,14 @@ class DPM86XX:
 
         :return: True if the output is enabled (on), False if it is disabled (off).
         :rtype: bool
-        :raises AssertionError: If the communication port has not been configured.
+        :raises RuntimeError: If the communication port has not been configured.
         :raises IOError: If the device's response is shorter than expected, suggesting that the data received is
                 incomplete or corrupted.
         :raises ValueError: If converting the relevant portion of the response to an integer is unsuccessful,
                 indicating an invalid response format.
         """
-        assert self._port is not None
-        command = self.make_read_output_status_command(self._address)
-        self._port.write(command)
-        response = self._port.read_until(b'\r\n')
-        if len(response) < 11:
-            raise IOError(f'Response is too short: {response}')
-        result = int(response[7:-3])  # may raise ValueError
+        command = self._read_commands['output_status']
+        result = _parse_response_value(self._transceive(command), command)
         return result == 1
 
     def ensure_output_status(self, status: Union[bool,int], retries: int = 3) -> bool:
@@ -533,15 +1179,14 @@ class DPM86XX:
         :type retries: int
         :return: True if the output status setting is successfully verified within the given number of retries, False otherwise.
         :rtype: bool
-        :raises AssertionError: If the communication port has not been configured.
+        :raises RuntimeError: If the communication port has not been configured.
         :raises IOError: If the device's response is shorter than expected, suggesting that the data received is
                 incomplete or corrupted.
         :raises ValueError: If converting the relevant portion of the response to an integer is unsuccessful,
                 indicating an invalid response format.
         """
         # Ensure status to be boolean
-        if type(status) is int:
-            status = not status == 0
+        status = bool(status)
         while retries > 0:
             self.set_output_status(status)
             if self.get_output_status() == status:
@@ -562,24 +1207,18 @@ class DPM86XX:
         :type current_in_milliampere: int
         :return: True if the device acknowledges receipt of the command with b':AAok\r\n' (AA being the address), signifying
                  that the command was received. It does not ascertain the command's successful execution.
-        :raises AssertionError: If the communication port has not been configured.
+        :raises RuntimeError: If the communication port has not been configured.
         """
-        assert self._port is not None
-        command = self.make_write_current_command(self._address, current_in_milliampere)
-        self._port.write(command)
-        response = self._port.read_until(b'\r\n')
-        # The device always responses with b':AAok\r\n' (AA being the address). This does only mean the device received
-        # a command-like byte string, disregarding its actual content. Thus, we cannot tell if the
-        # command was successful, but only if the command was received.
-        return response == f':{self._address:02d}ok\r\n'.encode()
+        command = self.make_write_current_in_milliampere_command(self._address, current_in_milliampere)
+        return self._is_acknowledgement(self._transceive(command))
 
     def set_current(self, current: float) -> bool:
         """
         Sets the device's current level, converting the given value from amperes to milliamperes before sending the
         command.
 
-        Converts the specified current from amperes to milliamperes by multiplying by 1000. This conversion
-        may raise a ValueError if the provided current cannot be converted to an integer.
+        Converts the specified current from amperes to milliamperes by multiplying by 1000 and rounding to the nearest
+        milliampere. This conversion may raise a ValueError if the provided current cannot be converted to a float.
         The method then delegates the command sending to `set_current_in_milliampere`, which sends the
         appropriate command to the device.
 
@@ -587,10 +1226,10 @@ class DPM86XX:
         :type current: float
         :return: True if the device acknowledges receipt of the command with b':AAok\r\n' (AA being the address), indicating
                  the command was received. This does not guarantee the command's successful execution.
-        :raises AssertionError: If the communication port has not been configured.
-        :raises ValueError: If the current value cannot be converted to an integer.
+        :raises RuntimeError: If the communication port has not been configured.
+        :raises ValueError: If the current value cannot be converted to a float.
         """
-        current_in_milliampere = int(current * 1000)  # may raise ValueError
+        current_in_milliampere = round(float(current) * 1000)  # float() may raise ValueError
         return self.set_current_in_milliampere(current_in_milliampere)
 
     def get_current_in_milliampere(self) -> int:
@@ -603,18 +1242,12 @@ class DPM86XX:
 
         :return: The current limit from the device, in milliamperes.
         :rtype: int
-        :raises AssertionError: If the communication port has not been configured.
+        :raises RuntimeError: If the communication port has not been configured.
         :raises IOError: If the device's response is shorter than expected, indicating incomplete or corrupted data.
         :raises ValueError: If converting the response to an integer fails, suggesting an invalid response format.
         """
-        assert self._port is not None
-        command = self.make_read_current_setting_command(self._address)
-        self._port.write(command)
-        response = self._port.read_until(b'\r\n')
-        if len(response) < 11:
-            raise IOError(f'Response is too short: {response}')
-        result = int(response[7:-3])  # may raise ValueError
-        return result
+        command = self._read_commands['current_setting']
+        return _parse_response_value(self._transceive(command), command)
 
     def get_current(self) -> float:
         """
@@ -626,7 +1259,7 @@ class DPM86XX:
 
         :return: The current limit from the device, in amperes.
         :rtype: float
-        :raises AssertionError: If the communication port has not been configured.
+        :raises RuntimeError: If the communication port has not been configured.
         :raises IOError: If the device's response is shorter than expected, indicating incomplete or corrupted data.
         :raises ValueError: If converting the response to an integer fails, suggesting an invalid response format.
         """
@@ -647,7 +1280,7 @@ class DPM86XX:
         :type retries: int
         :return: True if the current limit setting is successfully verified within the given number of retries, False otherwise.
         :rtype: bool
-        :raises AssertionError: If the communication port has not been configured.
+        :raises RuntimeError: If the communication port has not been configured.
         :raises IOError: If the response from the device is shorter than expected, suggesting incomplete
                          or corrupted data.
         :raises ValueError: If converting the response to an integer fails, indicating an invalid response format.
@@ -674,17 +1307,75 @@ class DPM86XX:
         :type current: Union[float, int]
         :return: True if the device acknowledges receipt of the command with b':AAok\r\n' (AA being the address), indicating the command
                  was received in the correct format. This does not confirm the successful execution of the command.
-        :raises AssertionError: If the communication port has not been configured.
+        :raises RuntimeError: If the communication port has not been configured.
         """
-        assert self._port is not None
         # Beware: If voltage and current given as int, they will get converted in centivolts and milliamperes!
         command = self.make_write_voltage_and_current_command(self._address, voltage, current)
-        self._port.write(command)
-        response = self._port.read_until(b'\r\n')
-        # The device always responses with b':AAok\r\n' (AA being the address). This does only mean the device received
-        # a command-like byte string, disregarding its actual content. Thus, we cannot tell if the
-        # command was successful, but only if the command was received.
-        return response == f':{str(self._address):02d}ok\r\n'.encode()
+        return self._is_acknowledgement(self._transceive(command))
+
+    def set_voltage_and_current_batch(self, settings: Iterable[Tuple[Union[float, int], Union[float, int]]],
+                                      inter_command_delay: float = 0.0) -> List[bool]:
+        """
+        Sends a sequence of voltage and current settings, e.g. a ramp, without waiting for each acknowledgment.
+
+        All commands are sent with `send_batch` and the acknowledgments are only collected at the end, so a sequence
+        of N settings does not pay N full round trips. Voltage and current are interpreted as in
+        `set_voltage_and_current`. As with the other setters, an acknowledgment (b':AAok\r\n', AA being the address)
+        only confirms the receipt of a well-formed command.
+
+        :param settings: Pairs of voltage and current levels, in volts and amperes if floats, or centivolts and
+                         milliamperes if integers.
+        :type settings: Iterable[Tuple[Union[float, int], Union[float, int]]]
+        :param inter_command_delay: The time to wait after each setting, in seconds. Default is 0.
+        :type inter_command_delay: float
+        :return: For every setting, True if the device acknowledged its receipt, False otherwise.
+        :rtype: List[bool]
+        :raises RuntimeError: If the communication port has not been configured.
+        :raises ValueError: If any voltage or current is outside their acceptable ranges. Nothing is sent then.
+        """
+        address = self._address
+        commands = [self.make_write_voltage_and_current_command(address, voltage, current)
+                    for voltage, current in settings]
+        return list(map(self._is_acknowledgement, self.send_batch(commands, inter_command_delay)))
+
+    def set_voltage_and_current_and_enable(self, voltage: Union[float, int], current: Union[float, int]) -> bool:
+        """
+        Sets both the voltage and current levels and enables the output in a single transfer, see `reset_to`.
+
+        :param voltage: The voltage level to set, in volts if a float, or centivolts if an integer.
+        :type voltage: Union[float, int]
+        :param current: The current level to set, in amperes if a float, or milliamperes if an integer.
+        :type current: Union[float, int]
+        :return: True if the device acknowledges receipt of both commands, False otherwise.
+        :rtype: bool
+        :raises RuntimeError: If the communication port has not been configured.
+        :raises ValueError: If the voltage or current is outside their acceptable ranges.
+        """
+        return self.reset_to(voltage, current, output=True)
+
+    def reset_to(self, voltage: Union[float, int], current: Union[float, int], output: bool = False) -> bool:
+        """
+        Brings the device into a known state of voltage, current and output status in a single transfer.
+
+        The voltage and current are set with the combined command, and the output status command follows in the same
+        write to the serial port before any acknowledgment is read, e.g. to reset the device between tests. Voltage
+        and current are interpreted as in `set_voltage_and_current`. As with the other setters, the acknowledgments
+        (b':AAok\r\n', AA being the address) only confirm the receipt of well-formed commands.
+
+        :param voltage: The voltage level to set, in volts if a float, or centivolts if an integer.
+        :type voltage: Union[float, int]
+        :param current: The current level to set, in amperes if a float, or milliamperes if an integer.
+        :type current: Union[float, int]
+        :param output: The output status to set, True to enable the output. Default is False.
+        :type output: bool
+        :return: True if the device acknowledges receipt of both commands, False otherwise.
+        :rtype: bool
+        :raises RuntimeError: If the communication port has not been configured.
+        :raises ValueError: If the voltage or current is outside their acceptable ranges.
+        """
+        commands = (self.make_write_voltage_and_current_command(self._address, voltage, current),
+                    self.make_write_output_status_command(self._address, output))
+        return all(map(self._is_acknowledgement, self.send_batch(commands)))
 
     def get_actual_current_in_milliamperes(self) -> int:
         """
@@ -696,18 +1387,12 @@ class DPM86XX:
 
         :return: The actual current output from the device, in milliamperes.
         :rtype: int
-        :raises AssertionError: If the communication port has not been configured.
+        :raises RuntimeError: If the communication port has not been configured.
         :raises IOError: If the device's response is shorter than expected, indicating incomplete or corrupted data.
         :raises ValueError: If converting the response to an integer fails, suggesting an invalid response format.
         """
-        assert self._port is not None
-        command = self.make_read_actual_current_command(self._address)
-        self._port.write(command)
-        response = self._port.read_until(b'\r\n')
-        if len(response) < 11:
-            raise IOError(f'Response is too short: {response}')
-        result = int(response[7:-3])  # may raise ValueError
-        return result
+        command = self._read_commands['actual_current']
+        return _parse_response_value(self._transceive(command), command)
 
     def get_actual_current(self) -> float:
         """
@@ -718,7 +1403,7 @@ class DPM86XX:
 
         :return: The actual current output from the device, in amperes.
         :rtype: float
-        :raises AssertionError: If the communication port has not been configured.
+        :raises RuntimeError: If the communication port has not been configured.
         :raises IOError: If the device's response is shorter than expected, indicating incomplete or corrupted data.
         :raises ValueError: If converting the response to an integer fails, suggesting an invalid response format.
         """
@@ -734,19 +1419,18 @@ class DPM86XX:
 
         :return: True if the device is operating in Constant Voltage (CV) mode, False if operating in Constant Current (CC) mode.
         :rtype: bool
-        :raises AssertionError: If the communication port has not been configured.
-        :raises IOError: If the device's response is shorter than expected, suggesting incomplete or corrupted data.
-        :raises ValueError: If converting the response to an integer fails, indicating an invalid response format.
-        """
-        assert self._port is not None
-        command = self.make_read_cc_cv_status_command(self._address)
-        self._port.write(command)
-        response = self._port.read_until(b'\r\n')
-        if len(response) < 11:
-            raise IOError(f'Response is too short: {response}')
-        result = int(response[7:-3])  # may raise ValueError
-        # 1 means CC (constant current), 0 means CV (constant voltage)
-        return result == 0
+        :raises RuntimeError: If the communication port has not been configured.
+        :raises IOError: If the device's response is not a well-formed CC/CV status, suggesting incomplete or corrupted
+                         data.
+        """
+        command = self._read_commands['cc_cv_status']
+        response = self._transceive(command)
+        # The status is a single digit, b'1' means CC (constant current), b'0' means CV (constant voltage). Comparing
+        # the byte at its fixed offset saves converting the value with int().
+        if (len(response) != 11 or not response.startswith(command[:_VALUE_START])
+                or response[_VALUE_START] not in b'01'):
+            raise IOError(f'Invalid CC/CV status response: {response}')
+        return response[_VALUE_START] == 0x30
 
     def is_in_cv_mode(self) -> bool:
         """
@@ -757,11 +1441,9 @@ class DPM86XX:
 
         :return: True if the device is in CV mode, False otherwise.
         :rtype: bool
-        :raises AssertionError: If the communication port has not been configured.
-        :raises IOError: If the device's response is shorter than expected, indicating that the data is incomplete or
-                corrupted.
-        :raises ValueError: If there is an issue converting the response to an integer, suggesting an invalid response
-                format.
+        :raises RuntimeError: If the communication port has not been configured.
+        :raises IOError: If the device's response is not a well-formed CC/CV status, indicating that the data is
+                incomplete or corrupted.
         """
         return self.get_cc_cv_status()
 
@@ -774,10 +1456,8 @@ class DPM86XX:
 
         :return: True if the device is in CC mode, False otherwise (indicating CV mode).
         :rtype: bool
-        :raises AssertionError: If the communication port has not been configured.
-        :raises IOError: If the device's response is shorter than expected, indicating that the data is incomplete or
-                corrupted.
-        :raises ValueError: If there is an issue converting the response to an integer, suggesting an invalid response
-                format.
+        :raises RuntimeError: If the communication port has not been configured.
+        :raises IOError: If the device's response is not a well-formed CC/CV status, indicating that the data is
+                incomplete or corrupted.
         """
         return not self.get_cc_cv_status()
@@ -1,7 +1,48 @@
 import random
-from unittest import TestCase
+import re
+import threading
+from concurrent.futures import Future
+from unittest import TestCase, mock
 
-from dpm86xx.dpm86xx import DPM86XX
+from dpm86xx.dpm86xx import DPM86XX, _enable_low_latency
+
+# Format of regular commands and of commands with a second operand
+COMMAND_REGEX = re.compile(b':\\d\\d[rw]\\d\\d=\\d{1,5},\r\n')
+COMMAND_WITH_TWO_OPERANDS_REGEX = re.compile(b':\\d\\d[rw]\\d\\d=\\d{1,5},\\d{1,5},\r\n')
+
+
+class FakePort:
+    # Stands in for serial.Serial: records written commands and replays the given device responses, one response
+    # becoming available per written command.
+    def __init__(self, *responses):
+        self.written = []
+        self._pending = list(responses)
+        self._responses = bytearray()
+
+    def write(self, data):
+        self.written.append(bytes(data))
+        for _ in range(min(data.count(b'\r\n'), len(self._pending))):
+            self._responses += self._pending.pop(0)
+        return len(data)
+
+    def close(self):
+        self.closed = True
+
+    @property
+    def in_waiting(self):
+        return len(self._responses)
+
+    def read(self, size=1):
+        response = bytes(self._responses[:size])
+        del self._responses[:size]
+        return response
+
+    def read_until(self, expected=b'\n', size=None):
+        end = self._responses.find(expected)
+        end = len(self._responses) if end < 0 else end + len(expected)
+        response = bytes(self._responses[:end])
+        del self._responses[:end]
+        return response
 
 
 class TestDPM86XX(TestCase):
@@ -9,25 +50,28 @@ class TestDPM86XX(TestCase):
         self.dpm = DPM86XX()
 
     def test_make_command(self):
-        # Test all combination of:
-        # - all valid addresses
+        # Test the bounds of the valid ranges and 5000 random combinations of:
+        # - valid addresses
         # - both modes
-        # - all valid function members
-        # - and 100 random values in the valid range
-        for address in range(1, 100):
-            for function in ['r', 'w']:
-                for function_member in range(0, 100):
-                    for operand in [random.randint(0, 65536) for _ in range(100)]:
-                        self.assertRegex(
-                            self.dpm.make_command(address, function, function_member, operand),
-                            # Assert format of regular command
-                            ':\\d\\d[rw]\\d\\d=\\d{1,5},\r\n'.encode()
-                        )
+        # - valid function members
+        # - and values in the valid range
+        samples = [(address, function, function_member, operand)
+                   for address in (1, 99)
+                   for function in ('r', 'w')
+                   for function_member in (0, 99)
+                   for operand in (0, 65536)]
+        # Fixed seed, so a failure can be reproduced
+        rng = random.Random(8605)
+        samples += [(rng.randint(1, 99), rng.choice('rw'), rng.randint(0, 99), rng.randint(0, 65536))
+                    for _ in range(5000)]
+        for address, function, function_member, operand in samples:
+            self.assertRegex(
+                self.dpm.make_command(address, function, function_member, operand),
+                # Assert format of regular command
+                COMMAND_REGEX
+            )
         # Test second operand format
-        self.assertRegex(
-            self.dpm.make_command(1, 'r', 1, 12345, 12345),
-            ':\\d\\d[rw]\\d\\d=\\d{1,5},\\d{1,5},\r\n'.encode()
-        )
+        self.assertRegex(self.dpm.make_command(1, 'r', 1, 12345, 12345), COMMAND_WITH_TWO_OPERANDS_REGEX)
         with self.assertRaises(ValueError):
             # Address out of range
             self.dpm.make_command(0, 'w', 1, 1234)
@@ -38,6 +82,12 @@ class TestDPM86XX(TestCase):
             # operand out of range
             self.dpm.make_command(0, 'w', 100, 123456)
 
+    def test_invalid_address(self):
+        with mock.patch('serial.Serial') as serial_class, self.assertRaises(ValueError):
+            DPM86XX('/dev/ttyUSB0', address=100)
+        # Rejected before the port was opened
+        serial_class.assert_not_called()
+
     def test_make_write_voltage_command(self):
         self.assertEqual(self.dpm.make_write_voltage_command(1, 1234), b':01w10=1234,\r\n')
         self.assertEqual(self.dpm.make_write_voltage_command(1, 12.34), b':01w10=1234,\r\n')
@@ -48,6 +98,37 @@ class TestDPM86XX(TestCase):
             # Voltage out of range
             self.dpm.make_write_voltage_command(1, 70.3)
 
+    def test_make_write_commands_in_volts_and_amperes(self):
+        self.assertEqual(self.dpm.make_write_voltage_in_volts_command(1, 12.34), b':01w10=1234,\r\n')
+        # Integers are volts and amperes as well
+        self.assertEqual(self.dpm.make_write_voltage_in_volts_command(1, 12), b':01w10=1200,\r\n')
+        self.assertEqual(self.dpm.make_write_current_in_amperes_command(1, 12.345), b':01w11=12345,\r\n')
+        self.assertEqual(self.dpm.make_write_current_in_amperes_command(1, 1), b':01w11=1000,\r\n')
+        self.assertEqual(self.dpm.make_write_volts_and_amperes_command(1, 12.34, 12.345), b':01w20=1234,12345,\r\n')
+        with self.assertRaises(ValueError):
+            # Voltage out of range
+            self.dpm.make_write_voltage_in_volts_command(1, 70.3)
+        with self.assertRaises(ValueError):
+            # Current out of range
+            self.dpm.make_write_current_in_amperes_command(1, 25)
+        with self.assertRaises(ValueError):
+            # Voltage out of range
+            self.dpm.make_write_volts_and_amperes_command(1, -1.0, 1.0)
+
+    def test_make_write_commands_with_float_subclass(self):
+        # Float subclasses, e.g. numpy.float64, are treated like floats
+        class Float(float):
+            pass
+        self.assertEqual(self.dpm.make_write_voltage_command(1, Float(12.34)), b':01w10=1234,\r\n')
+        self.assertEqual(self.dpm.make_write_current_command(1, Float(12.345)), b':01w11=12345,\r\n')
+        self.assertEqual(self.dpm.make_write_voltage_and_current_command(1, Float(12.34), Float(12.345)),
+                         b':01w20=1234,12345,\r\n')
+
+    def test_make_write_commands_round_floats(self):
+        # 7.23 * 100 and 0.29 * 1000 are slightly below the intended integers in binary floating point
+        self.assertEqual(self.dpm.make_write_voltage_command(1, 7.23), b':01w10=723,\r\n')
+        self.assertEqual(self.dpm.make_write_current_command(1, 0.29), b':01w11=290,\r\n')
+
     def test_make_write_current_command(self):
         self.assertEqual(self.dpm.make_write_current_command(1, 12345), b':01w11=12345,\r\n')
         self.assertEqual(self.dpm.make_write_current_command(1, 12.345), b':01w11=12345,\r\n')
@@ -73,3 +154,333 @@ class TestDPM86XX(TestCase):
         with self.assertRaises(ValueError):
             # Current out of range
             self.dpm.make_write_voltage_and_current_command(1, 1, -1)
+
+    def test_make_read_commands(self):
+        self.assertEqual(self.dpm.make_read_maximum_output_voltage_command(1), b':01r00=0,\r\n')
+        self.assertEqual(self.dpm.make_read_maximum_output_current_command(1), b':01r01=0,\r\n')
+        self.assertEqual(self.dpm.make_read_voltage_setting_command(1), b':01r10=0,\r\n')
+        self.assertEqual(self.dpm.make_read_current_setting_command(1), b':01r11=0,\r\n')
+        self.assertEqual(self.dpm.make_read_output_status_command(1), b':01r12=0,\r\n')
+        self.assertEqual(self.dpm.make_read_actual_voltage_command(12), b':12r30=0,\r\n')
+        self.assertEqual(self.dpm.make_read_actual_current_command(12), b':12r31=0,\r\n')
+        self.assertEqual(self.dpm.make_read_cc_cv_status_command(99), b':99r32=0,\r\n')
+        self.assertEqual(self.dpm.make_read_temperature_command(99), b':99r33=0,\r\n')
+        # Repeated reads return the very same cached object
+        self.assertIs(self.dpm.make_read_temperature_command(99), self.dpm.make_read_temperature_command(99))
+        with self.assertRaises(ValueError):
+            # Address out of range
+            self.dpm.make_read_temperature_command(0)
+
+    def test_make_command_without_validation(self):
+        self.addCleanup(setattr, DPM86XX, 'validate_commands', True)
+        DPM86XX.validate_commands = False
+        # Out-of-range operand is formatted as is instead of raising
+        self.assertEqual(self.dpm.make_command(1, 'w', 10, 123456), b':01w10=123456,\r\n')
+        with self.assertRaises(KeyError):
+            # Not turned into a command for address 99
+            self.dpm.make_command(-1, 'w', 10, 5)
+        with self.assertRaises(KeyError):
+            self.dpm.make_command(100, 'w', 10, 5)
+        with self.assertRaises(KeyError):
+            self.dpm.make_command(1, 'x', 10, 5)
+        # The address of write commands is checked only if validation is enabled, also for commands built before
+        self.assertEqual(self.dpm.make_write_voltage_command(0, 100), b':00w10=100,\r\n')
+        self.assertEqual(self.dpm.make_read_temperature_command(0), b':00r33=0,\r\n')
+        DPM86XX.validate_commands = True
+        with self.assertRaises(ValueError):
+            self.dpm.make_command(1, 'w', 10, 123456)
+        with self.assertRaises(ValueError):
+            self.dpm.make_write_voltage_command(0, 100)
+        with self.assertRaises(ValueError):
+            self.dpm.make_read_temperature_command(0)
+        with self.assertRaises(ValueError):
+            # Unknown function
+            self.dpm.make_command(1, 'x', 10, 1234)
+
+    def test_make_commands_batch(self):
+        self.assertEqual(self.dpm.make_read_commands_batch(range(1, 4), 30),
+                         [b':01r30=0,\r\n', b':02r30=0,\r\n', b':03r30=0,\r\n'])
+        self.assertEqual(self.dpm.make_write_voltage_commands_batch([1, 1, 2], [1234, 12.34, 5.0]),
+                         [b':01w10=1234,\r\n', b':01w10=1234,\r\n', b':02w10=500,\r\n'])
+        self.assertEqual(self.dpm.make_write_voltage_and_current_commands_batch([1, 2], [1234, 5.0], [12345, 0.1]),
+                         [b':01w20=1234,12345,\r\n', b':02w20=500,100,\r\n'])
+        with self.assertRaises(ValueError):
+            # Address out of range
+            self.dpm.make_read_commands_batch([1, 100], 30)
+        with self.assertRaises(ValueError):
+            # Voltage out of range
+            self.dpm.make_write_voltage_commands_batch([1], [70.3])
+
+    def test_make_write_commands_in_base_units(self):
+        self.assertEqual(self.dpm.make_write_voltage_in_centivolts_command(1, 1234), b':01w10=1234,\r\n')
+        self.assertEqual(self.dpm.make_write_current_in_milliampere_command(1, 12345), b':01w11=12345,\r\n')
+        self.assertEqual(self.dpm.make_write_centivolts_and_milliampere_command(1, 1234, 12345),
+                         b':01w20=1234,12345,\r\n')
+        # Repeated writes of the same value return the very same cached object
+        self.assertIs(self.dpm.make_write_voltage_in_centivolts_command(1, 1234),
+                      self.dpm.make_write_voltage_in_centivolts_command(1, 1234))
+        with self.assertRaises(ValueError):
+            # Voltage out of range
+            self.dpm.make_write_voltage_in_centivolts_command(1, 6001)
+        with self.assertRaises(ValueError):
+            # Current out of range
+            self.dpm.make_write_current_in_milliampere_command(1, 24001)
+        with self.assertRaises(ValueError):
+            # Current out of range
+            self.dpm.make_write_centivolts_and_milliampere_command(1, 1234, -1)
+
+
+class TestDPM86XXFakePort(TestCase):
+    def setUp(self):
+        self.dpm = DPM86XX(address=2)
+
+    def connect(self, *responses):
+        self.dpm._port = FakePort(*responses)
+        return self.dpm._port
+
+    def test_acknowledged_writes(self):
+        port = self.connect(b':02ok\r\n', b':02ok\r\n', b':01ok\r\n')
+        self.assertTrue(self.dpm.set_voltage(5.0))
+        self.assertTrue(self.dpm.set_voltage_and_current(5.0, 100))
+        # Acknowledgement from a different address
+        self.assertFalse(self.dpm.set_output_status(True))
+        self.assertEqual(port.written, [b':02w10=500,\r\n', b':02w20=500,100,\r\n', b':02w12=1,\r\n'])
+
+    def test_reads(self):
+        port = self.connect(b':02r30=1234.\r\n', b':02r32=1.\r\n')
+        self.assertEqual(self.dpm.get_actual_voltage(), 12.34)
+        self.assertTrue(self.dpm.is_in_cc_mode())
+        self.assertEqual(port.written, [b':02r30=0,\r\n', b':02r32=0,\r\n'])
+        self.connect(b':02r32=0.\r\n', b':02r32=2.\r\n')
+        self.assertTrue(self.dpm.is_in_cv_mode())
+        with self.assertRaises(IOError):
+            # Neither CC nor CV
+            self.dpm.get_cc_cv_status()
+        self.connect(b':02r33=\r\n')
+        with self.assertRaises(IOError):
+            # Response too short
+            self.dpm.get_temperature()
+        self.connect(b':02r31=1234.\r\n')
+        with self.assertRaises(IOError):
+            # Response to another command
+            self.dpm.get_actual_voltage()
+        for truncated in (b':02r30=12345.\r', b':02r30=1234'):
+            self.connect(truncated)
+            with self.assertRaises(IOError):
+                # Frame cut off by a timeout
+                self.dpm.get_actual_voltage_in_centivolts()
+        # Reading a response stops at its end, also for the shortest and longest responses
+        self.connect(b':02r33=9.\r\n', b':02r30=12345.\r\n')
+        self.assertEqual(self.dpm.get_temperature(), 9)
+        self.assertEqual(self.dpm.get_actual_voltage_in_centivolts(), 12345)
+        # Responses read ahead are kept for the next read
+        self.connect(b':02r30=12345.\r\n', b':02r31=1234.\r\n')
+        self.assertEqual(self.dpm.send_batch([b':02r30=0,\r\n', b':02r31=0,\r\n']),
+                         [b':02r30=12345.\r\n', b':02r31=1234.\r\n'])
+
+    def test_wait_until_stable(self):
+        port = self.connect(b':02r30=120.\r\n', b':02r30=480.\r\n', b':02r30=499.\r\n')
+        self.assertTrue(self.dpm.wait_until_stable(5.0, timeout=1.0))
+        self.assertEqual(port.written, [b':02r30=0,\r\n'] * 3)
+        # Gives up after the timeout
+        self.connect(*[b':02r30=120.\r\n'] * 10)
+        self.assertFalse(self.dpm.wait_until_stable(5.0, timeout=0.02))
+
+    def test_stale_input_discarded(self):
+        port = self.connect(b':02r33=25.\r\n', b':02ok\r\n')
+        # Late remainder of a response that timed out, partly already received
+        self.dpm._received += b':02r30=12'
+        port._responses += b'34.\r\n'
+        self.assertEqual(self.dpm.get_temperature(), 25)
+        port._responses += b':02ok\r\n'
+        self.assertEqual(self.dpm.send_batch([b':02w12=0,\r\n']), [b':02ok\r\n'])
+        self.assertEqual(port.in_waiting, 0)
+
+    def test_silent_device(self):
+        class SilentPort(FakePort):
+            # Counts the reads, each of which would wait for the full timeout on a real port
+            reads = 0
+
+            def read(self, size=1):
+                self.reads += 1
+                return super().read(size)
+
+        port = self.dpm._port = SilentPort()
+        with self.assertRaises(IOError):
+            self.dpm.get_temperature()
+        self.assertEqual(port.reads, 1)
+        port = self.dpm._port = SilentPort()
+        self.assertEqual(self.dpm.send_batch([b':02w12=0,\r\n'] * 3), [b''] * 3)
+        self.assertEqual(port.reads, 1)
+
+    def test_read_deadline(self):
+        class TricklingPort(FakePort):
+            # Keeps sending bytes, but never a terminator
+            def read(self, size=1):
+                return b'0' * size
+
+        self.dpm._port = TricklingPort()
+        with mock.patch('dpm86xx.dpm86xx._RESPONSE_TIMEOUT', 0.05), self.assertRaises(IOError):
+            # The garbage is handed out after the deadline and rejected as response
+            self.dpm.get_temperature()
+
+    def test_set_voltage_and_current_round(self):
+        port = self.connect(b':02ok\r\n', b':02ok\r\n')
+        self.assertTrue(self.dpm.set_voltage(7.23))
+        self.assertTrue(self.dpm.set_current(0.29))
+        self.assertEqual(port.written, [b':02w10=723,\r\n', b':02w11=290,\r\n'])
+
+    def test_send_batch(self):
+        port = self.connect(b':02ok\r\n', b':02r33=25.\r\n')
+        self.assertEqual(self.dpm.send_batch([b':02w10=500,\r\n', b':02r33=0,\r\n']),
+                         [b':02ok\r\n', b':02r33=25.\r\n'])
+        # Both commands went out with a single write
+        self.assertEqual(port.written, [b':02w10=500,\r\n:02r33=0,\r\n'])
+        port = self.connect(b':02ok\r\n', b':02ok\r\n')
+        self.assertTrue(self.dpm.set_voltage_and_current_and_enable(5.0, 100))
+        self.assertEqual(port.written, [b':02w20=500,100,\r\n:02w12=1,\r\n'])
+
+    def test_send_unknown_command(self):
+        port = self.connect(b':02ok\r\n')
+        with self.assertRaises(ValueError):
+            self.dpm.send_batch([b':02w12=0,\r\n', b':02x12=0,\r\n'])
+        with self.assertRaises(ValueError):
+            self.dpm.submit_command(b'\r\n')
+        # Rejected before anything was written
+        self.assertEqual(port.written, [])
+
+    def test_set_voltage_and_current_batch(self):
+        port = self.connect(b':02ok\r\n', b':02ok\r\n', b':02r31=0.\r\n')
+        self.assertEqual(self.dpm.set_voltage_and_current_batch([(1.0, 0.1), (200, 100), (3.0, 0.1)]),
+                         [True, True, False])
+        self.assertEqual(port.written, [b':02w20=100,100,\r\n:02w20=200,100,\r\n:02w20=300,100,\r\n'])
+        port = self.connect(b':02ok\r\n', b':02ok\r\n')
+        self.assertEqual(self.dpm.set_voltage_and_current_batch([(1.0, 0.1), (2.0, 0.1)], inter_command_delay=0.001),
+                         [True, True])
+        # Written one by one to honor the delay
+        self.assertEqual(port.written, [b':02w20=100,100,\r\n', b':02w20=200,100,\r\n'])
+        with self.assertRaises(ValueError):
+            # Voltage out of range
+            self.dpm.set_voltage_and_current_batch([(1.0, 0.1), (70.3, 0.1)])
+
+    def test_reset_to(self):
+        port = self.connect(b':02ok\r\n', b':02ok\r\n')
+        self.assertTrue(self.dpm.reset_to(5.0, 100))
+        # Both commands written at once
+        self.assertEqual(port.written, [b':02w20=500,100,\r\n:02w12=0,\r\n'])
+        self.connect(b':02ok\r\n', b':02r12=0.\r\n')
+        self.assertFalse(self.dpm.reset_to(5.0, 100, output=True))
+
+    def test_ensure_output_status(self):
+        port = self.connect(b':02ok\r\n', b':02r12=0.\r\n', b':02ok\r\n', b':02r12=1.\r\n')
+        self.assertTrue(self.dpm.ensure_output_status(2))
+        # Retried after the read back status did not match
+        self.assertEqual(port.written, [b':02w12=1,\r\n', b':02r12=0,\r\n', b':02w12=1,\r\n', b':02r12=0,\r\n'])
+
+    def test_port_not_configured(self):
+        with self.assertRaises(RuntimeError):
+            self.dpm.get_temperature()
+        with self.assertRaises(RuntimeError):
+            self.dpm.set_output_status(False)
+        with self.assertRaises(RuntimeError):
+            self.dpm.send_batch([b':02w12=0,\r\n'])
+
+    def test_submit_command(self):
+        port = self.connect(b':02ok\r\n', b':02r33=25.\r\n')
+        self.addCleanup(self.dpm.stop_sender)
+        acknowledgement = self.dpm.submit_command(b':02w12=0,\r\n')
+        temperature = self.dpm.submit_command(b':02r33=0,\r\n')
+        self.assertEqual(acknowledgement.result(timeout=5), b':02ok\r\n')
+        self.assertEqual(temperature.result(timeout=5), b':02r33=25.\r\n')
+        # Commands queued meanwhile may have been written at once
+        self.assertEqual(b''.join(port.written), b':02w12=0,\r\n:02r33=0,\r\n')
+        # Waits for all commands submitted so far
+        port = self.connect(*[b':02ok\r\n'] * 3)
+        futures = [self.dpm.submit_command(b':02w12=0,\r\n') for _ in range(3)]
+        self.dpm.flush(timeout=5)
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertEqual(b''.join(port.written), b':02w12=0,\r\n' * 3)
+        self.dpm.stop_sender()
+        # Nothing to wait for without a background thread
+        self.dpm.flush(timeout=5)
+        # Errors are reported through the future
+        self.dpm._port = None
+        with self.assertRaises(RuntimeError):
+            self.dpm.submit_command(b':02w12=0,\r\n').result(timeout=5)
+
+    def test_submit_command_batches(self):
+        port = self.connect(*[b':02ok\r\n'] * 5)
+        self.addCleanup(self.dpm.stop_sender)
+        self.dpm.sender_batch_size = 2
+        with self.dpm._lock:
+            # Queued while the sender is blocked
+            futures = [self.dpm.submit_command(b':02w12=0,\r\n') for _ in range(5)]
+        self.dpm.flush(timeout=5)
+        self.assertEqual([future.result() for future in futures], [b':02ok\r\n'] * 5)
+        self.assertLessEqual(max(written.count(b'\r\n') for written in port.written), 2)
+        # Only the futures from the first incomplete response onward fail
+        self.connect(b':02ok\r\n', b':02o')
+        batch = [(b':02w12=0,\r\n', Future()) for _ in range(3)]
+        self.dpm._send_batch_for_futures(batch)
+        self.assertEqual(batch[0][1].result(timeout=5), b':02ok\r\n')
+        for _, future in batch[1:]:
+            with self.assertRaises(IOError):
+                future.result(timeout=5)
+
+    def test_submit_and_stop_concurrently(self):
+        self.connect(*[b':02ok\r\n'] * 400)
+        self.addCleanup(self.dpm.stop_sender)
+        futures = []
+
+        def submit():
+            for _ in range(50):
+                futures.append(self.dpm.submit_command(b':02w12=0,\r\n'))
+
+        def stop():
+            for _ in range(50):
+                self.dpm.stop_sender()
+                self.dpm.flush(timeout=5)
+
+        threads = [threading.Thread(target=target) for target in (submit, submit, submit, stop, stop)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.dpm.stop_sender()
+        # Every command was sent, none was lost to a sender that had already stopped
+        self.assertEqual([future.result(timeout=5) for future in futures], [b':02ok\r\n'] * 150)
+
+    def test_context_manager(self):
+        port = self.connect(b':02ok\r\n')
+        with self.dpm as dpm:
+            self.assertTrue(dpm.submit_command(b':02w12=0,\r\n').result(timeout=5))
+        self.assertTrue(port.closed)
+        with self.assertRaises(RuntimeError):
+            self.dpm.get_temperature()
+        # Closing again does nothing
+        self.dpm.close()
+        # Waits for an exchange in progress
+        port = self.connect()
+        with self.dpm._lock:
+            closing = threading.Thread(target=self.dpm.close)
+            closing.start()
+            closing.join(0.05)
+            self.assertFalse(hasattr(port, 'closed'))
+        closing.join(5)
+        self.assertTrue(port.closed)
+
+    def test_enable_low_latency(self):
+        class LowLatencyPort(FakePort):
+            def set_low_latency_mode(self, low_latency_settings):
+                self.low_latency = low_latency_settings
+
+        class UnsupportedLowLatencyPort(FakePort):
+            def set_low_latency_mode(self, low_latency_settings):
+                raise ValueError('Failed to update ASYNC_LOW_LATENCY flag to True')
+
+        port = LowLatencyPort()
+        _enable_low_latency(port)
+        self.assertTrue(port.low_latency)
+        # Ports without support for the flag are used as they are
+        _enable_low_latency(UnsupportedLowLatencyPort())
+        _enable_low_latency(FakePort())
@@ -6,17 +6,22 @@ from dpm86xx.dpm86xx import DPM86XX
 
 
 class TestRealDPM86XX(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         # Initialize the DPM86XX instance with the test port from environment variables
         # The environment variable "DPM_TEST_PORT" must be set to the device's port,
         # e.g., "COM4" (Windows), "/dev/ttyUSB0" (Linux).
-        self.dpm = DPM86XX(os.environ['DPM_TEST_PORT'])
+        # The port is opened once and shared by all tests, tearDown resets the device in between.
+        cls.dpm = DPM86XX(os.environ['DPM_TEST_PORT'])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.dpm.close()
 
     def tearDown(self):
-        # Reset the device to a known state of 5.0 volts and 100 milliamperes after each test
-        self.dpm.set_voltage_and_current(5.0, 100)
-        # Ensure the device's output is turned off after each test
-        self.dpm.set_output_status(0)
+        # Reset the device to a known state of 5.0 volts and 100 milliamperes and ensure the device's output is turned
+        # off after each test
+        self.dpm.reset_to(5.0, 100, output=False)
 
     def test_read_temperature(self):
         # Test to read and print the temperature from the device
@@ -25,7 +30,8 @@ class TestRealDPM86XX(TestCase):
     def test_read_actual_voltage(self):
         # Test to read the actual voltage from the device after enabling the output
         self.dpm.set_output_status(1)
-        time.sleep(0.5)  # Wait for the device to stabilize
+        # Wait for the device to stabilize. Expects no load drawing the current limit, so the output settles in CV mode
+        self.assertTrue(self.dpm.wait_until_stable(self.dpm.get_voltage(), timeout=0.5))
         self.dpm.get_actual_voltage_in_centivolts()
         self.dpm.set_output_status(0)  # Ensure output is disabled after the test
 
@@ -111,22 +117,26 @@ class TestRealDPM86XX(TestCase):
     def test_set_voltage_and_current(self):
         # Test to set combinations of voltage and current
         self.dpm.set_output_status(0)  # Disable output before setting
-        for voltage in (0.1, 0.2, 0.4, 3.0, 5.0):
-            for current in (0.12, 0.22, 0.42, 1.0, 0.1):
-                self.dpm.set_voltage_and_current(voltage, current)
-                time.sleep(0.3)  # Allow time for the device to apply the settings
+        settings = [(voltage, current)
+                    for voltage in (0.1, 0.2, 0.4, 3.0, 5.0)
+                    for current in (0.12, 0.22, 0.42, 1.0, 0.1)]
+        # Allow time for the device to apply each setting, without waiting for the acknowledgments in between
+        self.assertTrue(all(self.dpm.set_voltage_and_current_batch(settings, inter_command_delay=0.3)))
 
     def test_read_actual_current(self):
         # Test to read and print the actual current output from the device
         self.dpm.set_output_status(1)
-        time.sleep(0.3)  # Wait briefly after enabling the output
+        # Wait briefly after enabling the output. Not waiting for the voltage, as it does not reach the setting if the
+        # load draws the current limit.
+        time.sleep(0.3)
         print(f'Current: {self.dpm.get_actual_current_in_milliamperes()}mA')
         self.dpm.set_output_status(0)  # Disable output after reading
 
     def test_cc_cv(self):
         # Test to determine and print whether the device is in CC or CV mode
         self.dpm.set_output_status(1)
-        time.sleep(0.3)  # Allow some time for the mode to be determined
+        # Allow some time for the mode to be determined. Not waiting for the voltage, as it does not reach the setting
+        # in CC mode.
+        time.sleep(0.3)
         print('In', 'CV' if self.dpm.is_in_cv_mode() else 'CC', 'mode.')
-        time.sleep(0.3)  # Brief pause before turning off the output
         self.dpm.set_output_status(0)